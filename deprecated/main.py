@@ -12,14 +12,21 @@ import argparse
 import os
 # import sys
 import yaml
-from prettytable import PrettyTable
 from jira import JIRA
+from jira.exceptions import JIRAError
+from requests.exceptions import RequestException
 import getpass
-import textwrap
-from datetime import datetime
+
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
 
 # Constants
 CONFIG_FILE = os.path.expanduser("~/.jira-cli-config.yaml")
+KEYRING_SERVICE = "jiracat"
+LIST_FIELDS = "key,created,updated,assignee,status,priority,summary,labels"
+SEARCH_BATCH_SIZE = 500
 
 
 class JiraManager:
@@ -45,25 +52,56 @@ class JiraManager:
         try:
             if os.path.exists(self.config_file):
                 with open(self.config_file, 'r') as file:
-                    config = yaml.safe_load(file)
+                    config = yaml.load(file, Loader=SafeLoader) or {}
                     self.server = config.get('server', self.server)
                     self.username = config.get('username', self.username)
                     self.api_token = config.get('api_token', self.api_token)
-        except Exception as e:
+        except (OSError, yaml.YAMLError) as e:
             print(f"Error loading config: {e}")
 
+        if not self.api_token and self.username:
+            self.api_token = self._keyring_get()
+
+    def _keyring_get(self):
+        """Read the API token from the OS keyring, if keyring is installed."""
+        try:
+            import keyring
+            from keyring.errors import KeyringError
+        except ImportError:
+            return None
+        try:
+            return keyring.get_password(KEYRING_SERVICE, self.username)
+        except KeyringError:
+            return None
+
+    def _keyring_set(self):
+        """Store the API token in the OS keyring, returns True on success."""
+        try:
+            import keyring
+            from keyring.errors import KeyringError
+        except ImportError:
+            return False
+        try:
+            keyring.set_password(KEYRING_SERVICE, self.username, self.api_token)
+            return True
+        except KeyringError as e:
+            print(f"Error saving token to keyring: {e}")
+            return False
+
     def _save_config(self):
         """Save configuration to file."""
         try:
             config = {
                 'server': self.server,
                 'username': self.username,
-                'api_token': self.api_token
             }
+            # Only fall back to the YAML file when there is no keyring
+            if not self._keyring_set():
+                config['api_token'] = self.api_token
             with open(self.config_file, 'w') as file:
-                yaml.dump(config, file)
+                yaml.dump(config, file, Dumper=SafeDumper)
             os.chmod(self.config_file, 0o600)  # Secure permissions
-        except Exception as e:
+        except (OSError, yaml.YAMLError) as e:
             print(f"Error saving config: {e}")
 
     def _connect(self):
@@ -75,10 +113,11 @@ class JiraManager:
         try:
             self.jira = JIRA(server=self.server, basic_auth=(
                 self.username, self.api_token))
-            # Test connection
-            self.jira.myself()
-            print(f"Connected to JIRA at {self.server} as {self.username}")
-        except Exception as e:
+            # Test connection only when asked to, it costs a round-trip
+            if os.environ.get('JIRA_VERIFY_CONNECT'):
+                self.jira.myself()
+                print(f"Connected to JIRA at {self.server} as {self.username}")
+        except (JIRAError, RequestException) as e:
             print(f"Error connecting to JIRA: {e}")
             self._prompt_credentials()
             self._connect()
@@ -98,99 +137,124 @@ class JiraManager:
         if save == 'y':
             self._save_config()
 
-    def list_issues(self, jql=None, max_results=50):
+    def list_issues(self, jql=None, max_results=50, fields=LIST_FIELDS,
+                    pretty=False):
         """List JIRA issues based on JQL filter."""
         if not jql:
             jql = "assignee = currentUser() ORDER BY updated DESC"
 
         try:
-            issues = self.jira.search_issues(jql, maxResults=max_results)
+            if not max_results or max_results > 100:
+                issues = self._search_paged(jql, max_results, fields)
+            else:
+                issues = self.jira.search_issues(
+                    jql, maxResults=max_results, fields=fields)
 
             if not issues:
                 print("No issues found matching your criteria.")
                 return
 
-            table = PrettyTable()
-            table.field_names = ["Key", "Created", "Updated", "Assignee",
-                                 "Status", "Priority", "Summary", "Tags",
-                                 "Link"]
-            table.align = "l"
-            table.max_width = 120
-
+            server = self.server
+            rows = []
             for issue in issues:
-                # Format date
-                updated = datetime.strptime(
-                    issue.fields.updated[:19], "%Y-%m-%dT%H:%M:%S")
-                updated_str = updated.strftime("%Y-%m-%d %H:%M")
-
-                created = datetime.strptime(
-                    issue.fields.created[:19], "%Y-%m-%dT%H:%M:%S")
-                created_str = created.strftime("%Y-%m-%d %H:%M")
-
-                # Concatenate tags
-                tags = ""
-                if hasattr(issue.fields, 'labels') and issue.fields.labels:
-                    tags = ", ".join(issue.fields.labels)
-
-                assignee = issue.fields.assignee.displayName if issue.fields.assignee else 'Unassigned'
-
-                # Add row
-                table.add_row([
+                f = issue.fields
+                created, updated = f.created, f.updated
+                priority = getattr(f, 'priority', None)
+                labels = getattr(f, 'labels', None)
+                summary = f.summary
+                if len(summary) > 60:
+                    summary = summary[:57] + "..."
+                rows.append([
                     issue.key,
-                    created_str,
-                    updated_str,
-                    assignee,
-                    issue.fields.status.name,
-                    issue.fields.priority.name if hasattr(
-                        issue.fields, 'priority') and issue.fields.priority else 'N/A',
-                    textwrap.shorten(issue.fields.summary,
-                                     width=60, placeholder="..."),
-                    tags,
-                    f"{self.server}/browse/{issue.key}"
+                    created[:10] + ' ' + created[11:16],
+                    updated[:10] + ' ' + updated[11:16],
+                    f.assignee.displayName if f.assignee else 'Unassigned',
+                    f.status.name,
+                    priority.name if priority else 'N/A',
+                    summary,
+                    ", ".join(labels) if labels else "",
+                    f"{server}/browse/{issue.key}"
                 ])
 
-            print(table)
+            header = ["Key", "Created", "Updated", "Assignee", "Status",
+                      "Priority", "Summary", "Tags", "Link"]
+
+            if pretty:
+                from prettytable import PrettyTable
+
+                table = PrettyTable()
+                table.field_names = header
+                table.align = "l"
+                table.max_width = 120
+                table.add_rows(rows)
+                print(table)
+            else:
+                # Plain fixed-width columns, cheap to build and easy to pipe
+                rows.insert(0, header)
+                widths = [max(len(row[i]) for row in rows)
+                          for i in range(len(header))]
+                fmt = "  ".join(f"{{:<{width}}}" for width in widths)
+                print("\n".join(fmt.format(*row).rstrip() for row in rows))
             print(f"\nTotal issues: {len(issues)}")
 
-        except Exception as e:
+        except (JIRAError, RequestException) as e:
             print(f"Error listing issues: {e}")
 
+    def _search_paged(self, jql, max_results, fields):
+        """Search in large pages to keep the number of round-trips low."""
+        issues = []
+        while not max_results or len(issues) < max_results:
+            batch_size = SEARCH_BATCH_SIZE
+            if max_results:
+                batch_size = min(batch_size, max_results - len(issues))
+            batch = self.jira.search_issues(
+                jql, startAt=len(issues), maxResults=batch_size, fields=fields)
+            issues.extend(batch)
+            # The server may cap a page below batch_size, so a short page
+            # is not the last one; rely on the totals it reports instead
+            total = getattr(batch, 'total', None)
+            if (not batch or getattr(batch, 'isLast', False)
+                    or (total is not None and len(issues) >= total)):
+                break
+        return issues
+
     def view_issue(self, issue_key):
         """View details of a specific JIRA issue."""
         try:
             issue = self.jira.issue(issue_key)
+            f = issue.fields
 
             # Header
             print("\n" + "="*80)
-            print(f"{issue.key}: {issue.fields.summary}")
+            print(f"{issue.key}: {f.summary}")
             print("="*80)
 
             # Details table
+            from prettytable import PrettyTable
+
             details = PrettyTable()
             details.field_names = ["Field", "Value"]
             details.align = "l"
             details.max_width = 60
 
             # Add fields
-            details.add_row(["Status", issue.fields.status.name])
-            details.add_row(["Priority", issue.fields.priority.name if hasattr(
-                issue.fields, 'priority') and issue.fields.priority else 'N/A'])
-            details.add_row(["Reporter", issue.fields.reporter.displayName])
+            details.add_row(["Status", f.status.name])
+            priority = getattr(f, 'priority', None)
+            details.add_row(["Priority", priority.name if priority else 'N/A'])
+            details.add_row(["Reporter", f.reporter.displayName])
             details.add_row(
-                ["Assignee", issue.fields.assignee.displayName if issue.fields.assignee else 'Unassigned'])
-            details.add_row(["Created", issue.fields.created[:10]])
-            details.add_row(["Updated", issue.fields.updated[:10]])
+                ["Assignee", f.assignee.displayName if f.assignee else 'Unassigned'])
+            details.add_row(["Created", f.created[:10]])
+            details.add_row(["Updated", f.updated[:10]])
 
             # Add components if available
-            if hasattr(issue.fields, 'components') and issue.fields.components:
-                components = ", ".join(
-                    [c.name for c in issue.fields.components])
+            if (components := getattr(f, 'components', None)):
+                components = ", ".join(c.name for c in components)
                 details.add_row(["Components", components])
 
             # Add fix versions if available
-            if hasattr(issue.fields, 'fixVersions') and issue.fields.fixVersions:
-                versions = ", ".join(
-                    [v.name for v in issue.fields.fixVersions])
+            if (versions := getattr(f, 'fixVersions', None)):
+                versions = ", ".join(v.name for v in versions)
                 details.add_row(["Fix Versions", versions])
 
             print(details)
@@ -198,23 +262,24 @@ class JiraManager:
             # Description
             print("\nDescription:")
             print("-"*80)
-            if issue.fields.description:
-                print(issue.fields.description)
+            if f.description:
+                print(f.description)
             else:
                 print("No description provided.")
             print("-"*80)
 
             # Comments
-            if hasattr(issue.fields, 'comment') and issue.fields.comment.comments:
+            comment_field = getattr(f, 'comment', None)
+            if comment_field and comment_field.comments:
                 print("\nComments:")
-                for comment in issue.fields.comment.comments:
+                for comment in comment_field.comments:
                     print("\n" + "-"*40)
                     print(
                         f"{comment.author.displayName} | {comment.created[:10]} {comment.created[11:16]}")
                     print("-"*40)
                     print(comment.body)
 
-        except Exception as e:
+        except (JIRAError, RequestException) as e:
             print(f"Error viewing issue {issue_key}: {e}")
 
     def create_issue(self, yaml_file):
@@ -222,7 +287,7 @@ class JiraManager:
         try:
             # Load YAML file
             with open(yaml_file, 'r') as file:
-                issue_data = yaml.safe_load(file)
+                issue_data = yaml.load(file, Loader=SafeLoader)
 
             # Validate required fields
             required_fields = ['project', 'summary', 'issuetype']
@@ -243,7 +308,8 @@ class JiraManager:
             if view == 'y':
                 self.view_issue(new_issue.key)
 
-        except Exception as e:
+        except (JIRAError, RequestException, OSError,
+                yaml.YAMLError) as e:
             print(f"Error creating issue: {e}")
 
 
@@ -278,6 +344,8 @@ def main():
         '--ne-status', help='Filter by status not equal to (e.g., "Done,Resolved")')
     list_parser.add_argument(
         '--tags', help='Filter by tags (e.g., "bug,security")')
+    list_parser.add_argument(
+        '--pretty', action='store_true', help='Render results as a table')
 
     # View command
     view_parser = subparsers.add_parser('view', help='View a JIRA issue')
@@ -340,7 +408,8 @@ def main():
         else:
             jql = args.jql
 
-        jira_manager.list_issues(jql=jql, max_results=args.max)
+        jira_manager.list_issues(
+            jql=jql, max_results=args.max, pretty=args.pretty)
 
     elif args.command == 'view':
         jira_manager.view_issue(args.issue_key)
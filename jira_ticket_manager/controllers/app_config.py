@@ -1,7 +1,10 @@
-import yaml
+import functools
+import json
 import os
 
 CONFIG_FILE = os.path.expanduser("~/.jira-cli-config.yaml")
+# Service name the API token is stored under in the OS keyring
+KEYRING_SERVICE = "jiracat"
 
 
 class AppConfig:
@@ -10,14 +13,93 @@ class AppConfig:
     def __init__(self, config_file=None):
         if not config_file:
             config_file = CONFIG_FILE
+        config = self._load(config_file)
+        self.server = config.get('server')
+        self.username = config.get('username')
+        self._api_token = config.get('api_token')
+        self._keyring_checked = False
+        self.default_project = config.get('default_project')
+        self.default_assignee = config.get('default_assignee')
+        self.max_results = config.get('max_results', 50)
+
+    @property
+    def api_token(self):
+        """API token from the config, else the OS keyring.
+
+        The keyring is only consulted on first access, so commands that
+        never open a Jira session don't import or unlock it.
+        """
+        if not self._api_token and not self._keyring_checked:
+            self._keyring_checked = True
+            self._api_token = self._keyring_token(self.username)
+        return self._api_token
+
+    @staticmethod
+    def _keyring_token(username):
+        """Look up the API token in the OS keyring, if keyring is installed."""
+        if not username:
+            return None
+        try:
+            import keyring
+            from keyring.errors import KeyringError
+        except ImportError:
+            return None
+        try:
+            return keyring.get_password(KEYRING_SERVICE, username)
+        except KeyringError:
+            return None
+
+    @staticmethod
+    def _load(config_file):
+        """Load config, preferring the JSON cache while it is up to date."""
+        cache_file = config_file + '.cache.json'
+        # The cache records which YAML it was built from; mtimes alone can
+        # go backwards (cp -p, restores, rsync), so require an exact match
+        stat = os.stat(config_file)
+        source = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}
+        try:
+            with open(cache_file, "r") as file:
+                cache = json.load(file)
+            if (isinstance(cache, dict) and cache.get('source') == source
+                    and isinstance(cache.get('config'), dict)):
+                return cache['config']
+        except (OSError, ValueError):
+            pass
+
+        # Only pay for importing PyYAML when the cache can't be used
+        import yaml
+        try:
+            from yaml import CSafeLoader as SafeLoader
+        except ImportError:
+            from yaml import SafeLoader
+
         with open(config_file, "r") as file:
-            config = yaml.safe_load(file)
-            self.server = config.get('server')
-            self.username = config.get('username')
-            self.api_token = config.get('api_token')
-            self.default_project = config.get('default_project')
-            self.default_assignee = config.get('default_assignee')
-            self.max_results = config.get('max_results', 50)
+            config = yaml.load(file, Loader=SafeLoader) or {}
+        if not isinstance(config, dict):
+            raise ValueError(
+                f"{config_file} must contain a mapping of settings")
+
+        # Cache holds the API token too, so create it owner-only
+        try:
+            fd = os.open(cache_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+                         0o600)
+            with os.fdopen(fd, "w") as file:
+                json.dump({'source': source, 'config': config}, file,
+                          default=str)
+            os.chmod(cache_file, 0o600)
+        except OSError:
+            pass
+        return config
 
     def __str__(self):
         return f"server: {self.server}, username: {self.username}, api_token: {self.api_token}, default_project: {self.default_project}, default_assignee: {self.default_assignee}, max_results: {self.max_results}"
+
+
+def get_app_config(config_file=None):
+    """Return the AppConfig for config_file, parsing it once per process."""
+    return _cached_app_config(config_file or CONFIG_FILE)
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_app_config(config_file):
+    return AppConfig(config_file)
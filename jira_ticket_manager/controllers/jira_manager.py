@@ -1,13 +1,50 @@
 from jira import JIRA
-from jira_ticket_manager.controllers.app_config import AppConfig
+from jira.exceptions import JIRAError
+from jira_ticket_manager.controllers.app_config import get_app_config
+from requests.adapters import HTTPAdapter
+from requests.exceptions import RequestException
+from urllib3.util.retry import Retry
+import os
 import sys
+import types
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Fields rendered by the list and single issue views
+LIST_FIELDS = "key,created,updated,assignee,status,priority,summary,labels"
+ISSUE_BODY_FIELDS = ("summary,status,priority,parent,issuetype,"
+                     "customfield_12432,labels,creator,assignee,reporter,"
+                     "created,updated,description")
+ISSUE_FIELDS = ISSUE_BODY_FIELDS + ",comment"
+# Page size used when pulling large result sets
+SEARCH_BATCH_SIZE = 500
+# Connection pool shared by all requests made through one JiraManager
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 20
+
+
+def _use_orjson():
+    """Have requests (and so the jira SDK) parse responses with orjson."""
+    import requests.models
+
+    # requests only calls loads and dumps; orjson.dumps returns bytes and
+    # rejects allow_nan, so keep the stdlib encoder
+    requests.models.complexjson = types.SimpleNamespace(
+        loads=orjson.loads, dumps=requests.models.complexjson.dumps)
+
+
+if orjson:
+    _use_orjson()
 
 
 class JiraManager:
     """Manages interactions with JIRA API."""
 
     def __init__(self, config_file=None):
-        self.app_config = AppConfig(config_file)
+        self.app_config = get_app_config(config_file)
         self.jira = None
 
         # Connect to Jira
@@ -25,44 +62,96 @@ class JiraManager:
             self.jira = JIRA(
                 server=self.app_config.server,
                 basic_auth=(
-                    self.app_config.username, self.app_config.api_token))
-            # Test connection
-            self.jira.myself()
-            print(
-                f"Connected to JIRA server: {self.app_config.server}",
-                file=sys.stderr)
-        except Exception as e:
+                    self.app_config.username, self.app_config.api_token),
+                get_server_info=False)
+            self._mount_pool()
+            # No request is made until the first call, which reports bad
+            # credentials itself; only test the connection when asked to
+            if os.environ.get('JIRA_VERIFY_CONNECT'):
+                self.jira.myself()
+                print(
+                    f"Connected to JIRA server: {self.app_config.server}",
+                    file=sys.stderr)
+        except (JIRAError, RequestException) as e:
             raise Exception(f"Failed to connect to JIRA: {e}")
 
-    def list_issues(self, jql=None, max_results=50):
-        """List JIRA issues."""
+    def _mount_pool(self):
+        """Keep connections alive and retry transient gateway errors."""
+        # jira's ResilientSession already retries connection errors and
+        # 429/503 (honouring Retry-After), so urllib3 only retries 502/504
+        # and hands the last response back rather than raising RetryError
+        adapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+            max_retries=Retry(total=3, connect=0, read=0, backoff_factor=0.3,
+                              status_forcelist=[502, 504],
+                              raise_on_status=False))
+        self.jira._session.mount('https://', adapter)
+        self.jira._session.mount('http://', adapter)
+
+    def list_issues(self, jql=None, max_results=50, fields=LIST_FIELDS):
+        """List JIRA issues.
+
+        Returns an empty list when nothing matches and None when the search
+        itself failed.
+        """
         if not jql:
             jql = "assignee = currentUser() ORDER BY created DESC"
 
         try:
-            issues = self.jira.search_issues(jql, maxResults=max_results)
+            if not max_results or max_results > 100:
+                issues = self._search_paged(jql, max_results, fields)
+            else:
+                issues = self.jira.search_issues(
+                    jql, maxResults=max_results, fields=fields)
 
             if not issues:
                 print("No issues found.", file=sys.stderr)
-                return
+                return []
 
             return issues
-        except Exception as e:
+        except (JIRAError, RequestException) as e:
             print(f"Failed to list issues: {e}", file=sys.stderr)
             return
 
-    def fetch_issue(self, issue_key):
+    def _search_paged(self, jql, max_results, fields):
+        """Search in large pages to keep the number of round-trips low."""
+        issues = []
+        while not max_results or len(issues) < max_results:
+            batch_size = SEARCH_BATCH_SIZE
+            if max_results:
+                batch_size = min(batch_size, max_results - len(issues))
+            batch = self.jira.search_issues(
+                jql, startAt=len(issues), maxResults=batch_size, fields=fields)
+            issues.extend(batch)
+            # The server may cap a page below batch_size, so a short page
+            # is not the last one; rely on the totals it reports instead
+            total = getattr(batch, 'total', None)
+            if (not batch or getattr(batch, 'isLast', False)
+                    or (total is not None and len(issues) >= total)):
+                break
+        return issues
+
+    def fetch_issue(self, issue_key, fields=ISSUE_FIELDS):
         """View details of a specific JIRA issue."""
         try:
-            issue = self.jira.issue(issue_key)
+            issue = self.jira.issue(issue_key, fields=fields)
             if not issue:
                 print(f"Issue {issue_key} not found.", file=sys.stderr)
                 return
             return issue
-        except Exception as e:
+        except (JIRAError, RequestException) as e:
             print(f"Failed to view issue: {e}", file=sys.stderr)
             return
 
+    def fetch_comments(self, issue_key):
+        """Fetch the comments of a specific JIRA issue."""
+        try:
+            return self.jira.comments(issue_key)
+        except (JIRAError, RequestException) as e:
+            print(f"Failed to fetch comments: {e}", file=sys.stderr)
+            return
+
     def create_issue(self, issue_data):
         """Create a JIRA issue with provided data."""
         try:
@@ -80,6 +169,6 @@ class JiraManager:
 
             return new_issue
 
-        except Exception as e:
+        except (JIRAError, RequestException) as e:
             print(f"Failed to create issue: {e}", file=sys.stderr)
             return
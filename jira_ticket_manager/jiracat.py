@@ -1,11 +1,36 @@
-from jira_ticket_manager.controllers.jira_manager import JiraManager
-from jira_ticket_manager.controllers.app_config import AppConfig
-from pprint import pprint
+from jira_ticket_manager.controllers.app_config import get_app_config
+from concurrent.futures import ThreadPoolExecutor
 import argparse
+import re
 import sys
 import webbrowser
-from rich.markdown import Markdown
-from rich.console import Console
+
+# Past these sizes rich's markdown rendering gets slow, print plain text
+MAX_RENDERED_LENGTH = 50 * 1024
+MAX_RENDERED_COMMENTS = 20
+
+# Jira {code} / {code:lang} blocks
+_CODE_RE = re.compile(r'\{code(?::([^}]+))?\}(.*?)\{code\}', re.DOTALL)
+
+# Metadata lines as (label, field name, formatter), skipped when unset
+_ISSUE_METADATA = [
+    ("Status", "status", lambda status: status.name),
+    ("Priority", "priority", lambda priority: priority.name),
+    ("Parent", "parent", lambda parent: parent.key),
+    ("Type", "issuetype", lambda issuetype: issuetype.name),
+    ("Brands", "customfield_12432",
+     lambda brands: ', '.join(brand.value for brand in brands)),
+    ("Labels", "labels", ', '.join),
+]
+_USER_METADATA = [
+    ("Creator", "creator", lambda user: user.displayName),
+    ("Assignee", "assignee", lambda user: user.displayName),
+    ("Reporter", "reporter", lambda user: user.displayName),
+]
+_DATE_METADATA = [
+    ("Created", "created", lambda date: date[:10]),
+    ("Updated", "updated", lambda date: date[:10]),
+]
 
 
 def setup_argument_parser():
@@ -28,81 +53,61 @@ def safe_append(metadata, key, value):
     return metadata
 
 
-def format_issue_as_markdown(issue):
-    """Format Jira issue as markdown string."""
-    markdown = f"# {issue.key}: {issue.fields.summary}\n\n"
-
-    issue_metadata, user_metadata, date_metdata = [], [], []
-
-    if issue.fields.status:
-        issue_metadata.append(f"**Status:** {issue.fields.status.name}")
-    if issue.fields.priority:
-        issue_metadata.append(f"**Priority:** {issue.fields.priority.name}")
-    if hasattr(issue.fields, 'parent') and issue.fields.parent:
-        issue_metadata.append(f"**Parent:** {issue.fields.parent.key}")
-    if issue.fields.issuetype:
-        issue_metadata.append(f"**Type:** {issue.fields.issuetype.name}")
-    if issue.fields.customfield_12432:
-        brands = [brand.value for brand in issue.fields.customfield_12432]
-        issue_metadata.append(f"**Brands:** {', '.join(brands)}")
-    if issue.fields.labels:
-        issue_metadata.append(f"**Labels:** {', '.join(issue.fields.labels)}")
-    if issue.fields.creator:
-        user_metadata.append(
-            f"**Creator:** {issue.fields.creator.displayName}")
-    if issue.fields.assignee:
-        user_metadata.append(
-            f"**Assignee:** {issue.fields.assignee.displayName}")
-    if issue.fields.reporter:
-        user_metadata.append(
-            f"**Reporter:** {issue.fields.reporter.displayName}")
-    if issue.fields.created:
-        date_metdata.append(
-            f"**Created:** {issue.fields.created.split('T')[0]}")
-    if issue.fields.updated:
-        date_metdata.append(
-            f"**Updated:** {issue.fields.updated.split('T')[0]}")
+def _metadata_lines(fields, specs):
+    return [f"**{label}:** {fmt(value)}" for label, name, fmt in specs
+            if (value := getattr(fields, name, None))]
+
+
+def format_issue_as_markdown(issue, comments=None):
+    """Format Jira issue as markdown string.
+
+    Comments are taken from ``comments`` when given, otherwise from the
+    issue's own comment field.
+    """
+    f = issue.fields
+    issue_metadata = _metadata_lines(f, _ISSUE_METADATA)
+    user_metadata = _metadata_lines(f, _USER_METADATA)
+    date_metdata = _metadata_lines(f, _DATE_METADATA)
 
     # Add metadata to markdown
-    markdown += "## Metadata\n\n"
-    markdown += '\n'.join(issue_metadata)
-    markdown += '\n\n'
-    markdown += '\n'.join(user_metadata)
-    markdown += '\n\n'
-    markdown += '\n'.join(date_metdata)
-    markdown += '\n\n'
+    parts = [f"# {issue.key}: {f.summary}", "", "## Metadata", ""]
+    parts.extend(issue_metadata)
+    parts.append("")
+    parts.extend(user_metadata)
+    parts.append("")
+    parts.extend(date_metdata)
+    parts.append("")
 
     # Add description
-    if issue.fields.description:
-        markdown += "## Description\n\n"
+    if (description := getattr(f, 'description', None)):
+        parts.extend(["## Description", ""])
         # Make sure code blocks are properly formatted
-        description = issue.fields.description
         # Convert Jira's {code} blocks to markdown code blocks
         if '{code' in description:
-            import re
-            description = re.sub(r'\{code(?::([^}]+))?\}(.*?)\{code\}',
-                                 lambda m: f"```{m.group(1) or ''}\n{m.group(2)}\n```",
-                                 description, flags=re.DOTALL)
-        markdown += f"{description}\n\n"
+            description = _CODE_RE.sub(
+                lambda m: f"```{m.group(1) or ''}\n{m.group(2)}\n```",
+                description)
+        parts.extend([description, ""])
 
     # Add comments
-    if hasattr(issue.fields, 'comment'):
-        markdown += "## Comments\n\n"
-        for comment in issue.fields.comment.comments:
-            author = comment.author.displayName if hasattr(
-                comment.author, 'displayName') else "Unknown"
-            created = comment.created.split('T')[0] if hasattr(
-                comment, 'created') else "Unknown date"
+    if comments is None and (comment_field := getattr(f, 'comment', None)):
+        comments = comment_field.comments
+    if comments is not None:
+        parts.extend(["## Comments", ""])
+        for comment in comments:
+            author = getattr(comment.author, 'displayName', "Unknown")
+            created = getattr(comment, 'created', None)
+            created = created[:10] if created else "Unknown date"
 
-            markdown += f"### {author} - {created}\n\n"
-            markdown += f"{comment.body}\n\n---\n\n"
+            parts.extend(
+                [f"### {author} - {created}", "", comment.body, "", "---", ""])
 
-    return markdown
+    return "\n".join(parts)
 
 
 def main():
     try:
-        app_config = AppConfig()
+        app_config = get_app_config()
     except Exception as e:
         print(f"Failed to load configuration: {e}")
         sys.exit(1)
@@ -114,11 +119,38 @@ def main():
         webbrowser.open(issue_url)
         sys.exit(0)
 
+    # Heavy imports are only needed when showing the issue in the terminal
+    from jira_ticket_manager.controllers.jira_manager import (
+        JiraManager, ISSUE_BODY_FIELDS)
+
     jira_manager = JiraManager()
-    issue = jira_manager.fetch_issue(args.issue_key)
-    markdown_text = format_issue_as_markdown(issue)
+
+    # Fetch the issue body and its comments concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        issue_future = executor.submit(
+            jira_manager.fetch_issue, args.issue_key, ISSUE_BODY_FIELDS)
+        comments_future = executor.submit(
+            jira_manager.fetch_comments, args.issue_key)
+        issue = issue_future.result()
+        comments = comments_future.result()
+
+    # fetch_issue / fetch_comments already reported what failed; the issue
+    # was fetched without its comment field, so there is nothing to fall
+    # back on when the comments are missing
+    if not issue or comments is None:
+        sys.exit(1)
+
+    markdown_text = format_issue_as_markdown(issue, comments)
+
+    if (len(markdown_text) > MAX_RENDERED_LENGTH
+            or len(comments or ()) > MAX_RENDERED_COMMENTS):
+        sys.stdout.write(markdown_text)
+        return
 
     # Display markdown in terminal using rich
+    from rich.markdown import Markdown
+    from rich.console import Console
+
     console = Console()
     markdown = Markdown(markdown_text)
     console.print(markdown)
@@ -1,13 +1,29 @@
 from datetime import datetime
-from jira_ticket_manager.controllers.jira_manager import JiraManager
-from jira_ticket_manager.controllers.app_config import AppConfig
-from prettytable import PrettyTable
+from jira_ticket_manager.controllers.app_config import get_app_config
 import argparse
 import sys
-import textwrap
 
+OUTPUT_DATE_FORMAT = "%Y-%m-%d %H:%M"
+HEADERS = ["Key", "Created", "Updated", "Assignee",
+           "Status", "Priority", "Summary", "Tags"]
+MAX_COLUMN_WIDTH = 120
+SUMMARY_WIDTH = 50
 
-def setup_argument_parser(default_project):
+# (argument, JQL template, comma separated list) used by parse_jql
+_JQL_RULES = [
+    ('my_issues', 'assignee = currentUser()', False),
+    ('my_reported', 'reporter = currentUser()', False),
+    ('project', 'project = {value}', False),
+    ('status', 'status IN ({value})', True),
+    ('ne_status', 'status NOT IN ({value})', True),
+    ('tags', 'labels IN ({value})', True),
+]
+
+
+_PARSER = None
+
+
+def _build_parser():
     parser = argparse.ArgumentParser(
         description='Filter and list JIRA issues')
     parser.add_argument('--jql', help='JIRA Query Language to filter issues')
@@ -18,16 +34,25 @@ def setup_argument_parser(default_project):
     parser.add_argument('--my-reported', action='store_true',
                         help='Show only issues reported by me')
     parser.add_argument(
-        '--project', help='Filter by project key', default=default_project)
+        '--project', help='Filter by project key')
     parser.add_argument(
         '--status', help='Comma separated list of statuses (e.g. "To Do, In Progress")')
     parser.add_argument(
         '--ne-status', help='Comma separated list of statuses to exclude (e.g. "Done, Resolved")')
     parser.add_argument(
         '--tags', help='Comma separated list of tags (e.g. "bug, enhancement")')
+    return parser
+
+
+def setup_argument_parser(default_project):
+    # Built once and reused when main() runs several times in one process
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _build_parser()
+    _PARSER.set_defaults(project=default_project)
 
     # Parse the arguments
-    args = parser.parse_args()
+    args = _PARSER.parse_args()
     return args
 
 
@@ -35,74 +60,87 @@ def parse_jql(args):
     # Build JQL from args
     jql_parts = []
 
-    if args.my_issues:
-        jql_parts.append('assignee = currentUser()')
-    if args.my_reported:
-        jql_parts.append('reporter = currentUser()')
-    if args.project:
-        jql_parts.append(f'project = {args.project}')
-    if args.status:
-        statues = args.status.split(',')
-        jql_parts.append('status IN ({})'.format(
-            ', '.join([f'"{status.strip()}"' for status in statues]))
-        )
-    if args.ne_status:
-        statues = args.ne_status.split(',')
-        jql_parts.append('status NOT IN ({})'.format(
-            ', '.join([f'"{status.strip()}"' for status in statues]))
-        )
-    if args.tags:
-        tags = args.tags.split(',')
-        jql_parts.append('labels IN ({})'.format(
-            ', '.join([f'"{tag.strip()}"' for tag in tags]))
-        )
+    for attr, template, is_list in _JQL_RULES:
+        value = getattr(args, attr)
+        if not value:
+            continue
+        if is_list:
+            value = ', '.join(f'"{item.strip()}"' for item in value.split(','))
+        jql_parts.append(template.format(value=value))
 
     return jql_parts
 
 
-def print_issues(issues):
-    table = PrettyTable()
+def format_date(value):
+    """Reformat a Jira timestamp as "YYYY-MM-DD HH:MM"."""
+    # Jira sends ISO-8601, so slicing is enough in all but odd cases
+    if len(value) >= 16:
+        return f"{value[:10]} {value[11:16]}"
+    return datetime.fromisoformat(value[:19]).strftime(OUTPUT_DATE_FORMAT)
 
-    table.field_names = ["Key", "Created", "Updated", "Assignee",
-                         "Status", "Priority", "Summary", "Tags"]
-    table.align = 'l'
-    table.max_width = 120
 
+def print_issues(issues):
+    # One list per column, so widths come from a single pass over each
+    columns = [[] for _ in HEADERS]
+    (keys, createds, updateds, assignees,
+     statuses, priorities, summaries, tag_lists) = columns
     for issue in issues:
+        f = issue.fields
+
         # Formate dates
-        date_format = "%Y-%m-%dT%H:%M:%S"
-        output_date_format = "%Y-%m-%d %H:%M"
-        created = datetime.strptime(issue.fields.created[:19], date_format)
-        create_str = created.strftime(output_date_format)
-        updated = datetime.strptime(issue.fields.updated[:19], date_format)
-        updated_str = updated.strftime(output_date_format)
+        create_str = format_date(f.created)
+        updated_str = format_date(f.updated)
 
         # Concatenate tags
-        tags = ''
-        if hasattr(issue.fields, 'labels') and issue.fields.labels:
-            tags = ', '.join(issue.fields.labels)
+        labels = getattr(f, 'labels', None)
+        tags = ', '.join(labels) if labels else ''
 
         # Set assignee
-        assignee = issue.fields.assignee.displayName if issue.fields.assignee else 'Unassigned'
+        assignee = f.assignee
+        assignee = assignee.displayName if assignee else 'Unassigned'
 
         # Set priority
-        priority = issue.fields.priority.name if issue.fields.priority else 'N/A'
+        priority = f.priority
+        priority = priority.name if priority else 'N/A'
 
         # Set short summary
-        summary = textwrap.shorten(
-            issue.fields.summary, width=50, placeholder='...')
-
-        table.add_row([issue.key, create_str, updated_str, assignee,
-                       issue.fields.status.name, priority, summary, tags])
-
-    print(table)
+        summary = f.summary
+        if len(summary) > SUMMARY_WIDTH:
+            summary = summary[:SUMMARY_WIDTH - 3] + '...'
+
+        keys.append(issue.key)
+        createds.append(create_str)
+        updateds.append(updated_str)
+        assignees.append(assignee)
+        statuses.append(f.status.name)
+        priorities.append(priority)
+        summaries.append(summary)
+        tag_lists.append(tags)
+
+    # Left aligned table, columns capped at MAX_COLUMN_WIDTH
+    widths = [min(MAX_COLUMN_WIDTH,
+                  max(len(header), max(map(len, column), default=0)))
+              for header, column in zip(HEADERS, columns)]
+    # Separator and row template are built once; "{:<w.w}" pads and
+    # truncates each cell to its column width
+    separator = '+' + '+'.join('-' * (width + 2) for width in widths) + '+\n'
+    row_format = '| ' + ' | '.join(
+        f'{{:<{width}.{width}}}' for width in widths) + ' |\n'
+
+    # Write rows as they are formatted rather than building the whole table
+    write = sys.stdout.write
+    write(separator + row_format.format(*HEADERS) + separator)
+    for row in zip(*columns):
+        write(row_format.format(*row))
+    write(separator)
+    sys.stdout.flush()
     print(f'\nTotal issues: {len(issues)}', file=sys.stderr)
 
 
 def main():
     """Main entry point for the script."""
     try:
-        app_config = AppConfig()
+        app_config = get_app_config()
         default_project = app_config.default_project
     except Exception as e:
         print(f"Failed to load configuration: {e}", file=sys.stderr)
@@ -110,6 +148,10 @@ def main():
 
     args = setup_argument_parser(default_project)
 
+    # Deferred so --help and argument errors don't pay for the jira SDK
+    from jira_ticket_manager.controllers.jira_manager import (
+        JiraManager, LIST_FIELDS)
+
     # Create a JiraManager instance
     jira_manager = JiraManager()
 
@@ -123,9 +165,13 @@ def main():
 
     # Get the issues
     try:
-        issues = jira_manager.list_issues(jql, args.max)
+        issues = jira_manager.list_issues(jql, args.max, fields=LIST_FIELDS)
+        if issues is None:
+            # list_issues already reported why the search failed
+            sys.exit(1)
         if not issues:
             print('No issues found matching your criteria.', file=sys.stderr)
+            return
 
         print_issues(issues)
 
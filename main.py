@@ -1,5 +1,4 @@
-from jira_ticket_manager.lib.JiraManager import JiraManager
+from jira_ticket_manager.jirals import main
 
 if __name__ == "__main__":
-    manager = JiraManager()
-    print(manager.list_tickeets())
+    main()
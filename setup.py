@@ -4,7 +4,8 @@ setup(
     name="jira_ticket_manager",
     version="0.1",
     packages=find_packages(),
-    install_requires=['jira', 'PyYAML', 'prettytable'],
+    install_requires=['jira', 'PyYAML', 'rich'],
+    extras_require={'keyring': ['keyring'], 'orjson': ['orjson']},
     entry_points={
         'console_scripts': [
             'jirals=jira_ticket_manager.jirals:main',